@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import typing as t
 
 import attr
@@ -123,7 +124,28 @@ def get_context(context: str | None) -> CloudClientContext:
     return CloudClientConfig.get_config().get_context(context)
 
 
-def get_rest_api_client(context: str | None = None) -> RestApiClient:
+def _get_context_or_current(context: str | None) -> CloudClientContext:
     cfg = CloudClientConfig.get_config()
-    ctx = cfg.get_context(context) if context else cfg.get_current_context()
-    return ctx.get_rest_api_client()
+    return cfg.get_context(context) if context else cfg.get_current_context()
+
+
+def get_rest_api_client(context: str | None = None) -> RestApiClient:
+    return _get_context_or_current(context).get_rest_api_client()
+
+
+_local_client = threading.local()
+
+
+def get_cached_rest_api_client(context: str | None = None) -> RestApiClient:
+    """Like ``get_rest_api_client``, but reuse the client (and its HTTP session) across calls.
+
+    The client is cached per thread, since ``requests.Session`` is not guaranteed to be
+    thread-safe, and only for the latest endpoint and API token, so that re-login takes
+    effect. The cloud config is still re-read from disk on every call.
+    """
+    ctx = _get_context_or_current(context)
+    key = (ctx.endpoint, ctx.api_token)
+    if getattr(_local_client, "key", None) != key:
+        _local_client.client = ctx.get_rest_api_client()
+        _local_client.key = key
+    return _local_client.client
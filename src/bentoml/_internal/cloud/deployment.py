@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import attr
 from deepmerge.merger import Merger
@@ -12,19 +15,31 @@ from ..tag import Tag
 from ..utils import bentoml_cattr
 from ..utils import first_not_none
 from ..utils import resolve_user_filepath
+from .config import get_cached_rest_api_client
 from .config import get_rest_api_client
 from .schemas import CreateDeploymentSchema
-from .schemas import DeploymentListSchema
+from .schemas import CreateDeploymentTargetSchema
 from .schemas import DeploymentMode
-from .schemas import DeploymentSchema
-from .schemas import DeploymentTargetCanaryRule
 from .schemas import DeploymentTargetConfig
 from .schemas import DeploymentTargetHPAConf
 from .schemas import DeploymentTargetRunnerConfig
 from .schemas import DeploymentTargetType
 from .schemas import FullDeploymentSchema
+from .schemas import LabelItemSchema
 from .schemas import UpdateDeploymentSchema
 
+if t.TYPE_CHECKING:
+    from .client import RestApiClient
+    from .schemas import BentoSchema
+    from .schemas import DeploymentListSchema
+    from .schemas import DeploymentSchema
+    from .schemas import DeploymentTargetCanaryRule
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    from json import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
 config_merger = Merger(
@@ -36,26 +51,53 @@ config_merger = Merger(
     type_conflict_strategies=["override"],
 )
 
+_RUNNER_FIELDS = frozenset(attr.fields_dict(DeploymentTargetRunnerConfig))
+
+
+def _fill_hpa_conf(
+    hpa_conf: DeploymentTargetHPAConf | None,
+    defaults: DeploymentTargetHPAConf,
+    config_name: str,
+) -> DeploymentTargetHPAConf:
+    """Return a copy of ``hpa_conf`` with its unset fields taken from ``defaults``."""
+    res = DeploymentTargetHPAConf() if hpa_conf is None else attr.evolve(hpa_conf)
+    for field in attr.fields(DeploymentTargetHPAConf):
+        value = getattr(defaults, field.name)
+        if value is None:
+            continue
+        if getattr(res, field.name) is None:
+            setattr(res, field.name, value)
+        else:
+            logger.warning(
+                "Key %s is already set in %s and will not be overwritten with hpa_conf.%s",
+                field.name,
+                config_name,
+                field.name,
+            )
+    return res
 
-@attr.define
-class Resource:
-    @classmethod
-    def for_hpa_conf(cls, **kwargs: t.Any) -> DeploymentTargetHPAConf:
-        return bentoml_cattr.structure(kwargs, DeploymentTargetHPAConf)
 
-    @classmethod
-    def for_runner(cls, **kwargs: t.Any) -> DeploymentTargetRunnerConfig:
-        exclusive_api_server_key = {
-            v for v in kwargs if v not in attr.fields_dict(DeploymentTargetRunnerConfig)
-        }
-        return bentoml_cattr.structure(
-            {k: v for k, v in kwargs.items() if k not in exclusive_api_server_key},
-            DeploymentTargetRunnerConfig,
-        )
+def resource_for_hpa(**kwargs: t.Any) -> DeploymentTargetHPAConf:
+    return bentoml_cattr.structure(kwargs, DeploymentTargetHPAConf)
+
+
+def resource_for_runner(**kwargs: t.Any) -> DeploymentTargetRunnerConfig:
+    # drop the API server exclusive keys
+    return bentoml_cattr.structure(
+        {k: v for k, v in kwargs.items() if k in _RUNNER_FIELDS},
+        DeploymentTargetRunnerConfig,
+    )
 
-    @classmethod
-    def for_api_server(cls, **kwargs: t.Any) -> DeploymentTargetConfig:
-        return bentoml_cattr.structure(kwargs, DeploymentTargetConfig)
+
+def resource_for_api_server(**kwargs: t.Any) -> DeploymentTargetConfig:
+    return bentoml_cattr.structure(kwargs, DeploymentTargetConfig)
+
+
+class Resource:
+    # Kept as a namespace for backward compatibility
+    for_hpa_conf = staticmethod(resource_for_hpa)
+    for_runner = staticmethod(resource_for_runner)
+    for_api_server = staticmethod(resource_for_api_server)
 
 
 class Deployment:
@@ -65,7 +107,7 @@ class Deployment:
         cluster_name: str,
         context: str | None = None,
     ) -> str:
-        cloud_rest_client = get_rest_api_client(context)
+        cloud_rest_client = get_cached_rest_api_client(context)
         res = cloud_rest_client.get_cluster(cluster_name)
         if not res:
             raise BentoMLException("Cannot get default kube namespace")
@@ -73,7 +115,7 @@ class Deployment:
 
     @classmethod
     def _get_default_cluster(cls, context: str | None = None) -> str:
-        cloud_rest_client = get_rest_api_client(context)
+        cloud_rest_client = get_cached_rest_api_client(context)
         res = cloud_rest_client.get_cluster_list(params={"count": 1})
         if not res:
             raise BentoMLException("Failed to get list of clusters.")
@@ -88,29 +130,58 @@ class Deployment:
         context: str | None = None,
         cluster_name: str | None = None,
     ) -> DeploymentSchema:
-        cloud_rest_client = get_rest_api_client(context)
+        cloud_rest_client = get_cached_rest_api_client(context)
         if cluster_name is None:
             cluster_name = cls._get_default_cluster(context)
         if create_deployment_schema.kube_namespace is None:
             create_deployment_schema.kube_namespace = cls._get_default_kube_namespace(
                 cluster_name, context
             )
-        for target in create_deployment_schema.targets:
-            if (
-                cloud_rest_client.get_bento(target.bento_repository, target.bento)
-                is None
-            ):
-                raise BentoMLException(
-                    f"Create deployment: {target.bento_repository}:{target.bento} does not exist"
-                )
-        if (
-            cloud_rest_client.get_deployment(
+        targets = create_deployment_schema.targets
+
+        def check_bentos(bentos: t.Iterable[BentoSchema | None]) -> None:
+            for target, bento in zip(targets, bentos):
+                if bento is None:
+                    raise BentoMLException(
+                        f"Create deployment: {target.bento_repository}:{target.bento} does not exist"
+                    )
+
+        def get_existing_deployment(client: RestApiClient) -> DeploymentSchema | None:
+            return client.get_deployment(
                 cluster_name,
                 create_deployment_schema.kube_namespace,
                 create_deployment_schema.name,
             )
-            is not None
-        ):
+
+        if len(targets) <= 1:
+            # A single target only needs two requests, make them on the pooled session
+            check_bentos(
+                cloud_rest_client.get_bento(target.bento_repository, target.bento)
+                for target in targets
+            )
+            existing_deployment = get_existing_deployment(cloud_rest_client)
+        else:
+            # Run the checks for multi-target specs concurrently. requests.Session is not
+            # guaranteed to be thread-safe, so each worker builds its own client once.
+            worker = threading.local()
+
+            def init_worker() -> None:
+                worker.client = get_rest_api_client(context)
+
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(targets) + 1), initializer=init_worker
+            ) as executor:
+                future = executor.submit(lambda: get_existing_deployment(worker.client))
+                check_bentos(
+                    executor.map(
+                        lambda target: worker.client.get_bento(
+                            target.bento_repository, target.bento
+                        ),
+                        targets,
+                    )
+                )
+                existing_deployment = future.result()
+        if existing_deployment is not None:
             raise BentoMLException("Create deployment: Deployment already exists")
         res = cloud_rest_client.create_deployment(
             cluster_name, create_deployment_schema
@@ -129,7 +200,7 @@ class Deployment:
         context: str | None = None,
         cluster_name: str | None = None,
     ) -> DeploymentSchema:
-        cloud_rest_client = get_rest_api_client(context)
+        cloud_rest_client = get_cached_rest_api_client(context)
         if cluster_name is None:
             cluster_name = cls._get_default_cluster(context)
         if kube_namespace is None:
@@ -215,7 +286,7 @@ class Deployment:
                     updated_config["hpa_conf"] = {}
                 config_merger.merge(updated_config["hpa_conf"], hpa_conf_dct)
             if "runners" in updated_config and updated_config["runners"] is not None:
-                for _, runner in updated_config["runners"].items():
+                for runner in updated_config["runners"].values():
                     if runner["hpa_conf"] is None:
                         runner["hpa_conf"] = {}
                     config_merger.merge(runner["hpa_conf"], hpa_conf_dct)
@@ -310,94 +381,65 @@ class Deployment:
             mode = DeploymentMode.Function
         if type is None:
             type = DeploymentTargetType.STABLE
+        # The enums are not exported publicly, so callers may pass their string values
+        mode = DeploymentMode(mode)
+        type = DeploymentTargetType(type)
         bento_tag = Tag.from_taglike(bento)
 
-        dct: dict[str, t.Any] = {
-            "name": deployment_name,
-            "kube_namespace": kube_namespace,
-            "mode": mode,
-            "description": description,
-        }
-        if labels:
-            dct["labels"] = [
-                {"key": key, "value": value} for key, value in labels.items()
-            ]
+        # Work on copies so that the configs passed in by the caller are left untouched
+        runners = (
+            {k: attr.evolve(v) for k, v in runners_config.items()}
+            if runners_config
+            else None
+        )
         if api_server_config is None:
-            _config: dict[str, t.Any] = {
-                "runners": {
-                    k: bentoml_cattr.unstructure(v) for k, v in runners_config.items()
-                }
-                if runners_config
-                else None,
-            }
+            config = DeploymentTargetConfig(runners=runners)
         else:
-            api_server_config.runners = runners_config
-            _config = bentoml_cattr.unstructure(api_server_config)
-
-        create_target: dict[str, t.Any] = {
-            "type": type,
-            "bento_repository": bento_tag.name,
-            "bento": bento_tag.version,
-            "config": _config,
-        }
-        if canary_rules:
-            create_target["canary_rules"] = [
-                bentoml_cattr.unstructure(i) for i in canary_rules
-            ]
+            config = attr.evolve(api_server_config, runners=runners)
 
         # Only change the value by the top-level param if it is not provided already in api_server_config or runner_config
         if hpa_conf:
-            hpa_conf_dct = bentoml_cattr.unstructure(hpa_conf)
-            _config_hpa_conf = _config.get("hpa_conf", None)
-            if _config_hpa_conf is None:
-                _config_hpa_conf = {}
-            for k, v in hpa_conf_dct.items():
-                if k not in _config_hpa_conf:
-                    _config_hpa_conf[k] = v
-                else:
-                    logger.warning(
-                        "Key %s is already set in API server config and will not be overwritten with hpa_conf.%s",
-                        k,
-                        k,
+            config.hpa_conf = _fill_hpa_conf(
+                config.hpa_conf, hpa_conf, "API server config"
+            )
+        if resource_instance and config.resource_instance is None:
+            config.resource_instance = resource_instance
+
+        if runners and (hpa_conf or resource_instance):
+            for runner in runners.values():
+                if hpa_conf:
+                    runner.hpa_conf = _fill_hpa_conf(
+                        runner.hpa_conf, hpa_conf, "runner config"
                     )
-            _config["hpa_conf"] = _config_hpa_conf
-            if "runners" in _config and _config["runners"] is not None:
-                _runner_config = _config["runners"]
-                for runner in _runner_config.values():
-                    _runner_hpa_conf = runner.get("hpa_conf", None)
-                    if _runner_hpa_conf is None:
-                        _runner_hpa_conf = {}
-                    for k, v in hpa_conf_dct.items():
-                        if k not in _runner_hpa_conf:
-                            _runner_hpa_conf[k] = v
-                        else:
-                            logger.warning(
-                                "Key %s is already set in runner config and will not be overwritten with hpa_conf.%s",
-                                k,
-                                k,
-                            )
-                    runner["hpa_conf"] = _runner_hpa_conf
-
-        if resource_instance:
-            if "resource_instance" not in _config:
-                _config["resource_instance"] = resource_instance
-            if "runners" in _config and _config["runners"] is not None:
-                for runner in _config["runners"].values():
-                    if "resource_instance" not in runner:
-                        runner["resource_instance"] = resource_instance
-
-        if expose_endpoint is not None and _config.get("enable_ingress", None) is None:
-            _config["enable_ingress"] = expose_endpoint
-
-        # setup the create target itself
-        dct["targets"] = [create_target]
+                if resource_instance and runner.resource_instance is None:
+                    runner.resource_instance = resource_instance
+
+        if expose_endpoint is not None and config.enable_ingress is None:
+            config.enable_ingress = expose_endpoint
+
+        create_deployment_schema = CreateDeploymentSchema(
+            name=deployment_name,
+            kube_namespace=kube_namespace,
+            mode=mode,
+            description=description,
+            labels=[LabelItemSchema(key, value) for key, value in labels.items()]
+            if labels
+            else None,
+            targets=[
+                CreateDeploymentTargetSchema(
+                    type=type,
+                    bento_repository=bento_tag.name,
+                    bento=bento_tag.version,
+                    config=config,
+                    canary_rules=list(canary_rules) if canary_rules else None,
+                )
+            ],
+        )
 
         return cls._create_deployment(
             context=context,
             cluster_name=cluster_name,
-            create_deployment_schema=bentoml_cattr.structure(
-                dct, CreateDeploymentSchema
-            ),
+            create_deployment_schema=create_deployment_schema,
         )
 
     @classmethod
@@ -410,7 +452,7 @@ class Deployment:
         count: int | None = None,
         start: int | None = None,
     ) -> DeploymentListSchema:
-        cloud_rest_client = get_rest_api_client(context)
+        cloud_rest_client = get_cached_rest_api_client(context)
         if cluster_name is None:
             cluster_name = cls._get_default_cluster(context)
         if query or start or count or search:
@@ -435,8 +477,7 @@ class Deployment:
         if isinstance(path_or_stream, str):
             real_path = resolve_user_filepath(path_or_stream, path_context)
             try:
-                with open(real_path, "r") as file:
-                    data = json.load(file)
+                data = json_loads(Path(real_path).read_bytes())
             except FileNotFoundError:
                 raise ValueError(f"File not found: {real_path}")
             except json.JSONDecodeError as e:
@@ -447,7 +488,7 @@ class Deployment:
                 )
         else:
             # load the data from trusted stream
-            data = json.load(path_or_stream)
+            data = json_loads(path_or_stream.read())
         deployment_schema = bentoml_cattr.structure(data, FullDeploymentSchema)
         return cls._create_deployment(
             create_deployment_schema=deployment_schema,
@@ -465,8 +506,7 @@ class Deployment:
         if isinstance(path_or_stream, str):
             real_path = resolve_user_filepath(path_or_stream, path_context)
             try:
-                with open(real_path, "r") as file:
-                    data = json.load(file)
+                data = json_loads(Path(real_path).read_bytes())
             except FileNotFoundError:
                 raise ValueError(f"File not found: {real_path}")
             except json.JSONDecodeError as e:
@@ -476,7 +516,7 @@ class Deployment:
                     f"An error occurred while reading the file: {real_path}\n{e}"
                 )
         else:
-            data = json.load(path_or_stream)
+            data = json_loads(path_or_stream.read())
         deployment_schema = bentoml_cattr.structure(data, FullDeploymentSchema)
         return cls._update_deployment(
             deployment_name=deployment_schema.name,
@@ -494,7 +534,7 @@ class Deployment:
         cluster_name: str | None = None,
         kube_namespace: str | None = None,
     ) -> DeploymentSchema:
-        cloud_rest_client = get_rest_api_client(context)
+        cloud_rest_client = get_cached_rest_api_client(context)
         if cluster_name is None:
             cluster_name = cls._get_default_cluster(context)
         if kube_namespace is None:
@@ -514,7 +554,7 @@ class Deployment:
         cluster_name: str | None = None,
         kube_namespace: str | None = None,
     ) -> DeploymentSchema:
-        cloud_rest_client = get_rest_api_client(context)
+        cloud_rest_client = get_cached_rest_api_client(context)
         if cluster_name is None:
             cluster_name = cls._get_default_cluster(context)
         if kube_namespace is None:
@@ -542,7 +582,7 @@ class Deployment:
         cluster_name: str | None = None,
         kube_namespace: str | None = None,
     ) -> DeploymentSchema:
-        cloud_rest_client = get_rest_api_client(context)
+        cloud_rest_client = get_cached_rest_api_client(context)
         if cluster_name is None:
             cluster_name = cls._get_default_cluster(context)
         if kube_namespace is None:
@@ -10,6 +10,11 @@ import attr
 import cattr
 from dateutil.parser import parse
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
 time_format = "%Y-%m-%d %H:%M:%S.%f"
 
 
@@ -52,9 +57,17 @@ def schema_from_json(json_content: str, cls: t.Type[T]) -> T:
     return cloud_converter.structure(dct, cls)
 
 
-def schema_to_json(obj: t.Any) -> str:
+def schema_to_json(obj: t.Any) -> bytes:
+    # Returns UTF-8 encoded bytes, so that non-ASCII text is never sent as a latin-1 encoded str body
     res = cloud_converter.unstructure(obj, obj.__class__)
-    return json.dumps(res)
+    if orjson is not None:
+        try:
+            # metadata (e.g. in model manifests) may contain non-str keys, which json.dumps stringifies
+            return orjson.dumps(res, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects values json.dumps supports, such as integers beyond 64-bit
+            pass
+    return json.dumps(res).encode()
 
 
 def schema_from_object(obj: t.Any, cls: t.Type[T]) -> T:
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from bentoml._internal.cloud import config as cloud_config_module
+from bentoml._internal.cloud.config import CloudClientConfig
+from bentoml._internal.cloud.config import CloudClientContext
+from bentoml._internal.cloud.config import get_cached_rest_api_client
+
+
+@pytest.fixture(name="cloud_config")
+def fixture_cloud_config() -> t.Generator[CloudClientConfig, None, None]:
+    config = CloudClientConfig(
+        contexts=[CloudClientContext("default", "https://cloud.example", "token")]
+    )
+    cloud_config_module._local_client.__dict__.clear()
+    with patch.object(CloudClientConfig, "get_config", return_value=config):
+        yield config
+    cloud_config_module._local_client.__dict__.clear()
+
+
+def test_cached_rest_api_client(cloud_config: CloudClientConfig):
+    client = get_cached_rest_api_client()
+    assert get_cached_rest_api_client() is client
+    assert get_cached_rest_api_client("default") is client
+
+    cloud_config.contexts[0].api_token = "new-token"
+    new_client = get_cached_rest_api_client()
+    assert new_client is not client
+    assert new_client.session.headers["X-YATAI-API-TOKEN"] == "new-token"
+
+
+def test_cached_rest_api_client_per_thread(cloud_config: CloudClientConfig):
+    client = get_cached_rest_api_client()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(get_cached_rest_api_client).result()
+    assert other is not client
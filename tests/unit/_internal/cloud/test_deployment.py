@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import typing as t
 from datetime import datetime
 from unittest.mock import patch
@@ -7,6 +8,7 @@ from unittest.mock import patch
 import attr
 import pytest
 
+from bentoml._internal.cloud.deployment import Deployment
 from bentoml._internal.cloud.schemas import BentoFullSchema
 from bentoml._internal.cloud.schemas import BentoImageBuildStatus
 from bentoml._internal.cloud.schemas import BentoManifestSchema
@@ -27,14 +29,18 @@ from bentoml._internal.cloud.schemas import DeploymentTargetHPAConf
 from bentoml._internal.cloud.schemas import DeploymentTargetRunnerConfig
 from bentoml._internal.cloud.schemas import DeploymentTargetSchema
 from bentoml._internal.cloud.schemas import DeploymentTargetType
+from bentoml._internal.cloud.schemas import FullDeploymentSchema
 from bentoml._internal.cloud.schemas import LabelItemSchema
 from bentoml._internal.cloud.schemas import ResourceType
 from bentoml._internal.cloud.schemas import UpdateDeploymentSchema
 from bentoml._internal.cloud.schemas import UserSchema
+from bentoml._internal.cloud.schemas import schema_to_json
 from bentoml.cloud import BentoCloudClient
 from bentoml.cloud import Resource
+from bentoml.exceptions import BentoMLException
 
 if t.TYPE_CHECKING:
+    from pathlib import Path
     from unittest.mock import MagicMock
 
 
@@ -193,6 +199,33 @@ def test_create_deployment(
     )
 
 
+@patch("bentoml._internal.cloud.deployment.Deployment._create_deployment")
+def test_create_deployment_str_mode_type(
+    mock_create_deployment: MagicMock, cloudclient: BentoCloudClient
+):
+    mock_create_deployment.side_effect = f_create
+
+    res = cloudclient.deployment.create(
+        deployment_name="test-xxx",
+        bento="iris_classifier:dqjxjyx2vweogcvj",
+        mode="deployment",
+        type="canary",
+    )
+    assert res == CreateDeploymentSchema(
+        targets=[
+            CreateDeploymentTargetSchema(
+                type=DeploymentTargetType.CANARY,
+                bento_repository="iris_classifier",
+                bento="dqjxjyx2vweogcvj",
+                config=DeploymentTargetConfig(),
+            )
+        ],
+        mode=DeploymentMode.Deployment,
+        name="test-xxx",
+    )
+    assert json.loads(schema_to_json(res))["targets"][0]["type"] == "canary"
+
+
 @patch("bentoml._internal.cloud.deployment.Deployment._create_deployment")
 def test_create_deployment_canary_rules(
     mock_create_deployment: MagicMock, cloudclient: BentoCloudClient
@@ -568,6 +601,160 @@ def test_create_deployment_api_server_runner_hpa_conf(
     )
 
 
+@patch("bentoml._internal.cloud.deployment.Deployment._create_deployment")
+def test_create_deployment_does_not_mutate_configs(
+    mock_create_deployment: MagicMock, cloudclient: BentoCloudClient
+):
+    mock_create_deployment.side_effect = f_create
+    api_server = Resource.for_api_server(resource_instance="t3-micro")
+    runner = Resource.for_runner(hpa_conf={"min_replicas": 3})
+    hpa_conf = Resource.for_hpa_conf(min_replicas=2, max_replicas=10)
+    cloudclient.deployment.create(
+        deployment_name="test-xxx",
+        bento="iris_classifier:dqjxjyx2vweogcvj",
+        api_server_config=api_server,
+        runners_config={"runner1": runner},
+        hpa_conf=hpa_conf,
+        resource_instance="t3-small",
+    )
+    assert api_server == Resource.for_api_server(resource_instance="t3-micro")
+    assert runner == Resource.for_runner(hpa_conf={"min_replicas": 3})
+
+
+@patch("bentoml._internal.cloud.deployment.Deployment._create_deployment")
+def test_create_deployment_from_file(
+    mock_create_deployment: MagicMock,
+    cloudclient: BentoCloudClient,
+    tmp_path: Path,
+):
+    mock_create_deployment.side_effect = f_create
+    deployment_file = tmp_path / "deployment.json"
+    deployment_file.write_text(
+        json.dumps(
+            {
+                "name": "test-xxx",
+                "cluster_name": "default",
+                "mode": "function",
+                "targets": [
+                    {
+                        "type": "stable",
+                        "bento_repository": "iris_classifier",
+                        "bento": "dqjxjyx2vweogcvj",
+                        "config": {
+                            "resource_instance": "t3-micro",
+                            "runners": {"runner1": {"hpa_conf": {"min_replicas": 3}}},
+                        },
+                    }
+                ],
+            }
+        )
+    )
+    res = cloudclient.deployment.create_from_file(str(deployment_file))
+    assert res == FullDeploymentSchema(
+        targets=[
+            CreateDeploymentTargetSchema(
+                type=DeploymentTargetType.STABLE,
+                bento_repository="iris_classifier",
+                bento="dqjxjyx2vweogcvj",
+                config=DeploymentTargetConfig(
+                    resource_instance="t3-micro",
+                    runners={
+                        "runner1": DeploymentTargetRunnerConfig(
+                            hpa_conf=DeploymentTargetHPAConf(min_replicas=3)
+                        )
+                    },
+                ),
+            )
+        ],
+        mode=DeploymentMode.Function,
+        name="test-xxx",
+        cluster_name="default",
+    )
+
+
+def test_create_deployment_from_invalid_file(
+    cloudclient: BentoCloudClient, tmp_path: Path
+):
+    deployment_file = tmp_path / "deployment.json"
+    deployment_file.write_text("{not json")
+    with pytest.raises(ValueError, match="Error decoding JSON file"):
+        cloudclient.deployment.create_from_file(str(deployment_file))
+
+
+@patch("bentoml._internal.cloud.deployment.ThreadPoolExecutor")
+@patch("bentoml._internal.cloud.deployment.get_rest_api_client")
+@patch("bentoml._internal.cloud.deployment.get_cached_rest_api_client")
+def test_create_deployment_checks_existence(
+    mock_get_client: MagicMock,
+    mock_new_client: MagicMock,
+    mock_executor: MagicMock,
+    cloudclient: BentoCloudClient,
+):
+    client = mock_get_client.return_value
+    client.get_bento.return_value = None
+    client.get_deployment.return_value = None
+    with pytest.raises(BentoMLException, match="does not exist"):
+        cloudclient.deployment.create(
+            deployment_name="test-xxx",
+            bento="iris_classifier:dqjxjyx2vweogcvj",
+            cluster_name="default",
+            kube_namespace="default",
+        )
+    client.get_bento.assert_called_once_with("iris_classifier", "dqjxjyx2vweogcvj")
+
+    client.get_bento.return_value = object()
+    client.get_deployment.return_value = object()
+    with pytest.raises(BentoMLException, match="already exists"):
+        cloudclient.deployment.create(
+            deployment_name="test-xxx",
+            bento="iris_classifier:dqjxjyx2vweogcvj",
+            cluster_name="default",
+            kube_namespace="default",
+        )
+    client.create_deployment.assert_not_called()
+
+    # a single target reuses the cached client, without threads or extra clients
+    assert mock_get_client.call_count == 2
+    mock_new_client.assert_not_called()
+    mock_executor.assert_not_called()
+
+
+@patch("bentoml._internal.cloud.deployment.get_rest_api_client")
+@patch("bentoml._internal.cloud.deployment.get_cached_rest_api_client")
+def test_create_deployment_checks_existence_multi_target(
+    mock_get_client: MagicMock, mock_new_client: MagicMock
+):
+    worker_client = mock_new_client.return_value
+    worker_client.get_bento.side_effect = lambda repo, version: (
+        None if repo == "missing" else object()
+    )
+    worker_client.get_deployment.return_value = None
+    targets = [
+        CreateDeploymentTargetSchema(
+            type=DeploymentTargetType.STABLE,
+            bento_repository=repo,
+            bento="dqjxjyx2vweogcvj",
+            config=DeploymentTargetConfig(),
+        )
+        for repo in ("iris_classifier", "fraud_detection", "summarizer")
+    ]
+    schema = CreateDeploymentSchema(
+        name="test-xxx", kube_namespace="default", targets=targets
+    )
+    Deployment._create_deployment(schema, cluster_name="default")
+    assert worker_client.get_bento.call_count == 3
+    worker_client.get_deployment.assert_called_once_with(
+        "default", "default", "test-xxx"
+    )
+    # one client per worker thread at most, not one per request
+    assert 1 <= mock_new_client.call_count <= 4
+    mock_get_client.return_value.create_deployment.assert_called_once()
+
+    targets[1].bento_repository = "missing"
+    with pytest.raises(BentoMLException, match="missing:dqjxjyx2vweogcvj"):
+        Deployment._create_deployment(schema, cluster_name="default")
+
+
 @pytest.fixture(name="update_schema", scope="function")
 def fixture_update_schema() -> UpdateDeploymentSchema:
     return UpdateDeploymentSchema(
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+
+from bentoml._internal.cloud.schemas import CreateDeploymentSchema
+from bentoml._internal.cloud.schemas import CreateDeploymentTargetSchema
+from bentoml._internal.cloud.schemas import DeploymentTargetConfig
+from bentoml._internal.cloud.schemas import DeploymentTargetType
+from bentoml._internal.cloud.schemas import ModelManifestSchema
+from bentoml._internal.cloud.schemas import cloud_converter
+from bentoml._internal.cloud.schemas import schema_to_json
+
+
+def test_schema_to_json_non_str_keys():
+    manifest = ModelManifestSchema(
+        module="bentoml.sklearn",
+        api_version="v1",
+        bentoml_version="1.1.0",
+        size_bytes=0,
+        metadata={1: "a", 2.5: "b", "c": {3: True}},
+    )
+    expected = json.loads(
+        json.dumps(cloud_converter.unstructure(manifest, ModelManifestSchema))
+    )
+    assert json.loads(schema_to_json(manifest)) == expected
+
+
+def test_schema_to_json_non_ascii_and_large_int():
+    manifest = ModelManifestSchema(
+        module="bentoml.sklearn",
+        api_version="v1",
+        bentoml_version="1.1.0",
+        size_bytes=0,
+        metadata={"description": "测试 é", "big": 2**64},
+    )
+    res = schema_to_json(manifest)
+    assert isinstance(res, bytes)
+    assert json.loads(res.decode("utf-8"))["metadata"] == {
+        "description": "测试 é",
+        "big": 2**64,
+    }
+
+
+def test_schema_to_json_deployment_description():
+    schema = CreateDeploymentSchema(
+        name="test-xxx",
+        description="测试",
+        targets=[
+            CreateDeploymentTargetSchema(
+                type=DeploymentTargetType.STABLE,
+                bento_repository="iris_classifier",
+                bento="dqjxjyx2vweogcvj",
+                config=DeploymentTargetConfig(),
+            )
+        ],
+    )
+    assert json.loads(schema_to_json(schema).decode("utf-8"))["description"] == "测试"